@@ -0,0 +1,347 @@
+"""
+Shared helpers for the Moltbook posting scripts.
+
+Holds the pieces that post-announcement.py, post-announcement-raw.py and
+post-introduction.py have in common: API key loading, markdown loading,
+and a rate-limited POST with retry/backoff over a shared HTTP client.
+
+Requires httpx (see scripts/requirements.txt); install ``httpx[http2]``
+to multiplex requests over a single HTTP/2 connection. orjson is used
+for encoding when installed.
+"""
+
+from __future__ import annotations
+
+import os
+import random
+import sys
+import threading
+import time
+from pathlib import Path
+from typing import Any, Callable
+
+import httpx
+
+try:
+    import orjson
+except ImportError:  # orjson is optional; fall back to the stdlib encoder
+    orjson = None
+
+try:
+    import h2  # noqa: F401  (enables HTTP/2 support in httpx)
+    _HTTP2_AVAILABLE = True
+except ImportError:  # h2 is optional; httpx falls back to HTTP/1.1
+    _HTTP2_AVAILABLE = False
+
+MOLTBOOK_API_BASE = "https://www.moltbook.com/api/v1"
+POST_ENDPOINT = f"{MOLTBOOK_API_BASE}/posts"
+
+# Retry policy: only transient failures are retried, never other 4xx responses
+RETRYABLE_STATUS_CODES = {429, 500, 502, 503, 504}
+MAX_RETRY_DELAY_SECONDS = 30.0
+
+
+# Rate limit handling for Moltbook API
+class RateLimitError(Exception):
+    """Raised when Moltbook returns a 429 rate limit response."""
+
+    def __init__(self, message: str, retry_after: str | None = None):
+        super().__init__(message)
+        self.retry_after = retry_after
+
+
+class TokenBucketRateLimiter:
+    """Thread-safe token bucket, mirroring the collector's TokenBucketRateLimiter.
+
+    Tokens refill in whole intervals; the bucket can also be drained early
+    from X-RateLimit-* response headers when the server reports a lower quota.
+    """
+
+    def __init__(
+        self,
+        max_tokens: int = 90,
+        refill_rate: int = 90,
+        refill_interval: float = 60.0,
+    ):
+        self.max_tokens = max_tokens
+        self.refill_rate = refill_rate
+        self.refill_interval = refill_interval
+        self._tokens = float(max_tokens)
+        self._last_refill = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        """Block until a token is available, then consume it."""
+        while True:
+            with self._lock:
+                self._refill()
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                wait = self.refill_interval - (time.monotonic() - self._last_refill)
+            time.sleep(max(wait, 0) + 0.1)
+
+    def update_from_headers(self, headers) -> None:
+        """Clamp tokens to the server's X-RateLimit-Remaining until its reset."""
+        remaining = headers.get("X-RateLimit-Remaining")
+        reset = headers.get("X-RateLimit-Reset")
+        if remaining is None:
+            return
+        try:
+            remaining_tokens = max(int(remaining), 0)
+            reset_seconds = float(reset) if reset is not None else self.refill_interval
+        except ValueError:
+            return
+        if reset_seconds > 1e9:
+            # Epoch timestamp rather than seconds-until-reset
+            reset_seconds = max(reset_seconds - time.time(), 0)
+        with self._lock:
+            self._refill()
+            if remaining_tokens < self._tokens:
+                self._tokens = float(remaining_tokens)
+                # Next refill lands when the server's window resets, however
+                # far past our own refill interval that is
+                self._last_refill = time.monotonic() + reset_seconds - self.refill_interval
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        elapsed = now - self._last_refill
+        if elapsed >= self.refill_interval:
+            periods = int(elapsed // self.refill_interval)
+            self._tokens = min(self.max_tokens, self._tokens + self.refill_rate * periods)
+            self._last_refill += periods * self.refill_interval
+
+    @property
+    def remaining(self) -> int:
+        with self._lock:
+            self._refill()
+            return int(self._tokens)
+
+
+# Guards for batched/concurrent posting: cap in-flight requests per host and
+# pace request starts with the same 90 req/min budget the collector uses.
+MAX_CONCURRENT_POSTS = 8
+
+# Shared HTTP client so retries reuse the same keep-alive TCP/TLS connection;
+# with HTTP/2, concurrent posts multiplex over that single connection.
+_CLIENT = httpx.Client(
+    http2=_HTTP2_AVAILABLE,
+    timeout=30,
+    limits=httpx.Limits(
+        max_connections=MAX_CONCURRENT_POSTS,
+        max_keepalive_connections=MAX_CONCURRENT_POSTS,
+    ),
+)
+_POST_SLOTS = threading.BoundedSemaphore(MAX_CONCURRENT_POSTS)
+_RATE_LIMITER = TokenBucketRateLimiter(90, 90, 60.0)
+
+
+def load_api_key() -> str:
+    """Load API key from environment variable."""
+    api_key = os.environ.get("MOLTBOOK_API_KEY")
+    if not api_key:
+        print("❌ Error: MOLTBOOK_API_KEY environment variable not set.")
+        print("")
+        print("   Set it with:")
+        print("   export MOLTBOOK_API_KEY='your-api-key-here'")
+        print("")
+        sys.exit(1)
+    return api_key
+
+
+def load_markdown_stripped(path: Path) -> str:
+    """Load a markdown file without its leading H1 title (passed separately)."""
+    if not path.exists():
+        print(f"❌ Error: Content file not found: {path}")
+        sys.exit(1)
+
+    # Read line by line so only the remaining body is held in memory
+    with path.open("r", encoding="utf-8") as f:
+        first_line = f.readline()
+        if not first_line.startswith("# "):
+            return first_line + f.read()
+        # Also remove any blank lines immediately after the title
+        for line in f:
+            if line.strip():
+                return line + f.read()
+
+    return ""
+
+
+def _server_retry_after(response: httpx.Response) -> float | None:
+    """Seconds the server asked us to wait, from Retry-After or the JSON body."""
+    retry_after = response.headers.get("Retry-After")
+    if retry_after:
+        try:
+            return float(retry_after)
+        except ValueError:
+            pass  # HTTP-date form; try the body hint instead
+    body = _json_or_none(response)
+    if not isinstance(body, dict):
+        return None
+    for key, seconds_per_unit in (
+        ("retry_after_minutes", 60),
+        ("retry_after_seconds", 1),
+        ("retry_after", 1),
+    ):
+        value = body.get(key)
+        if value is not None:
+            try:
+                return float(value) * seconds_per_unit
+            except (TypeError, ValueError):
+                return None
+    return None
+
+
+def retry_delay(
+    attempt: int,
+    base_delay_seconds: float,
+    response: httpx.Response | None = None,
+) -> float | None:
+    """Exponential backoff with jitter, honoring the server's wait on 429/503.
+
+    Returns None when the server asks for a longer wait than
+    MAX_RETRY_DELAY_SECONDS, since retrying sooner can only fail again.
+    """
+    if response is not None and response.status_code in (429, 503):
+        server_wait = _server_retry_after(response)
+        if server_wait is not None:
+            return server_wait if server_wait <= MAX_RETRY_DELAY_SECONDS else None
+    delay = base_delay_seconds * (2 ** (attempt - 1)) + random.uniform(0, 0.5)
+    return min(delay, MAX_RETRY_DELAY_SECONDS)
+
+
+def post_with_retry(
+    headers: dict[str, str],
+    payload: dict[str, Any],
+    *,
+    on_response: Callable[[httpx.Response], None] | None = None,
+    attempts: int = 3,
+    base_delay_seconds: float = 1.5,
+) -> httpx.Response:
+    """POST the payload, retrying connection errors and transient statuses.
+
+    Returns the final response without raising for its status; callers
+    decide how to report errors. A 429/503 whose requested wait exceeds
+    MAX_RETRY_DELAY_SECONDS is returned at once rather than retried.
+    ``on_response`` sees every response, including the ones that are retried.
+    """
+    # Serialize once up front: orjson yields bytes directly, otherwise let
+    # httpx encode the body instead of building an intermediate str.
+    body: dict[str, Any] = (
+        {"content": orjson.dumps(payload)} if orjson is not None else {"json": payload}
+    )
+
+    for attempt in range(1, attempts + 1):
+        try:
+            with _POST_SLOTS:
+                _RATE_LIMITER.acquire()
+                response = _CLIENT.post(POST_ENDPOINT, headers=headers, **body)
+            _RATE_LIMITER.update_from_headers(response.headers)
+        except (httpx.TimeoutException, httpx.NetworkError, httpx.RemoteProtocolError):
+            if attempt >= attempts:
+                raise
+            delay = retry_delay(attempt, base_delay_seconds)
+        else:
+            if on_response is not None:
+                on_response(response)
+            if response.status_code not in RETRYABLE_STATUS_CODES or attempt >= attempts:
+                return response
+            delay = retry_delay(attempt, base_delay_seconds, response)
+            if delay is None:
+                # Server wants a longer wait than we'll sleep; let the caller report it
+                return response
+
+        print("")
+        print(f"⚠️  Request failed (attempt {attempt}/{attempts}). Retrying in {delay:.1f}s...")
+        time.sleep(delay)
+
+    # Defensive fallback (should never hit)
+    raise RuntimeError("Unknown error posting to Moltbook.")
+
+
+def _report_error_response(response: httpx.Response) -> None:
+    """Print rate-limit or HTTP error context for a failed response."""
+    if response.status_code == 429:
+        print("")
+        print("⏳ Rate limited by Moltbook (HTTP 429).")
+        body = _json_or_none(response)
+        retry_after = _retry_after_hint(body)
+        if retry_after:
+            print(f"   Retry after: {retry_after}")
+        if response.text and not body:
+            print(f"   Response: {response.text}")
+        return
+
+    if response.status_code >= 400:
+        # Provide context to help diagnose server errors.
+        print("")
+        print(f"❌ HTTP Error: {response.status_code} {response.reason_phrase}")
+        if response.text:
+            print(f"   Response: {response.text}")
+        else:
+            print("   Response: No response")
+
+
+def _json_or_none(response: httpx.Response) -> Any:
+    """Decode a JSON response body, or return None if it isn't JSON."""
+    try:
+        return response.json()
+    except ValueError:
+        return None
+
+
+def _retry_after_hint(body: Any) -> str | None:
+    """Extract Moltbook's retry hint from a 429 JSON body, if present."""
+    if not isinstance(body, dict):
+        return None
+    return (
+        body.get("retry_after_minutes")
+        or body.get("retry_after_seconds")
+        or body.get("retry_after")
+    )
+
+
+def post_to_moltbook(
+    api_key: str,
+    title: str,
+    content: str,
+    submolt: str,
+    *,
+    attempts: int = 3,
+    base_delay_seconds: float = 1.5,
+) -> dict:
+    """Send the post to Moltbook API, retrying transient failures with backoff."""
+    headers = {
+        "Authorization": f"Bearer {api_key}",
+        "Content-Type": "application/json",
+        "Accept": "application/json",
+    }
+
+    payload = {
+        "title": title,
+        "content": content,
+        "submolt": submolt,
+    }
+
+    response = post_with_retry(
+        headers,
+        payload,
+        on_response=_report_error_response,
+        attempts=attempts,
+        base_delay_seconds=base_delay_seconds,
+    )
+
+    if response.status_code == 429:
+        raise RateLimitError(
+            "Rate limited by Moltbook.",
+            retry_after=(
+                _retry_after_hint(_json_or_none(response))
+                or response.headers.get("Retry-After")
+            ),
+        )
+    response.raise_for_status()
+
+    # The post went through; a non-JSON body shouldn't turn that into a failure
+    result = _json_or_none(response)
+    return result if isinstance(result, dict) else {}
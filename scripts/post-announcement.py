@@ -5,29 +5,33 @@ MoltInTheMist Announcement Poster
 This script posts an announcement to Moltbook using the configured API key.
 
 USAGE:
-    1. Set your MOLTBOOK_API_KEY environment variable
-    2. Review the post content in content/inaugural-post.md
-    3. Change DRY_RUN to False below (see SAFETY FLAG section)
-    4. Run: python scripts/post-announcement.py
+    1. Install dependencies: pip install -r scripts/requirements.txt
+    2. Set your MOLTBOOK_API_KEY environment variable
+    3. Review the post content in content/inaugural-post.md
+    4. Change DRY_RUN to False below (see SAFETY FLAG section)
+    5. Run: python scripts/post-announcement.py
 
 SAFETY:
     This script will NOT post anything until you manually change DRY_RUN to False.
 """
 
-import os
 import sys
 import json
-import requests
-import time
 from pathlib import Path
 
-# Rate limit handling for Moltbook API
-class RateLimitError(Exception):
-    """Raised when Moltbook returns a 429 rate limit response."""
+import httpx
 
-    def __init__(self, message: str, retry_after: str | None = None):
-        super().__init__(message)
-        self.retry_after = retry_after
+# Make the shared helpers importable when run as a script
+_scripts_dir = Path(__file__).parent
+if str(_scripts_dir) not in sys.path:
+    sys.path.insert(0, str(_scripts_dir))
+
+from _common import (
+    RateLimitError,
+    load_api_key,
+    load_markdown_stripped,
+    post_to_moltbook,
+)
 
 # ╔══════════════════════════════════════════════════════════════════════════════╗
 # ║                                                                              ║
@@ -44,8 +48,6 @@ DRY_RUN = True  # <-- CHANGE TO False TO ACTUALLY POST (after reviewing content)
 
 
 # Configuration
-MOLTBOOK_API_BASE = "https://www.moltbook.com/api/v1"
-POST_ENDPOINT = f"{MOLTBOOK_API_BASE}/posts"
 CONTENT_FILE = Path(__file__).parent.parent / "content" / "inaugural-post.md"
 
 # Post metadata
@@ -53,38 +55,6 @@ POST_TITLE = "I've been watching. Here's who actually runs Moltbook."
 POST_SUBMOLT = "general"  # or "announcement" if you have access
 
 
-def load_api_key() -> str:
-    """Load API key from environment variable."""
-    api_key = os.environ.get("MOLTBOOK_API_KEY")
-    if not api_key:
-        print("❌ Error: MOLTBOOK_API_KEY environment variable not set.")
-        print("")
-        print("   Set it with:")
-        print("   export MOLTBOOK_API_KEY='your-api-key-here'")
-        print("")
-        sys.exit(1)
-    return api_key
-
-
-def load_post_content() -> str:
-    """Load post content from markdown file."""
-    if not CONTENT_FILE.exists():
-        print(f"❌ Error: Content file not found: {CONTENT_FILE}")
-        sys.exit(1)
-    
-    content = CONTENT_FILE.read_text(encoding="utf-8")
-    
-    # Strip the H1 title from content (we pass it separately)
-    lines = content.split("\n")
-    if lines and lines[0].startswith("# "):
-        lines = lines[1:]  # Remove the title line
-        # Also remove any blank lines immediately after
-        while lines and not lines[0].strip():
-            lines = lines[1:]
-    
-    return "\n".join(lines)
-
-
 def preview_post(title: str, content: str, submolt: str):
     """Print a preview of what would be posted."""
     print("=" * 70)
@@ -102,85 +72,6 @@ def preview_post(title: str, content: str, submolt: str):
     print("=" * 70)
 
 
-def post_to_moltbook(
-    api_key: str,
-    title: str,
-    content: str,
-    submolt: str,
-    *,
-    attempts: int = 3,
-    base_delay_seconds: float = 1.5,
-) -> dict:
-    """Send the post to Moltbook API with basic retry/backoff."""
-    headers = {
-        "Authorization": f"Bearer {api_key}",
-        "Content-Type": "application/json",
-        "Accept": "application/json",
-    }
-    
-    payload = {
-        "title": title,
-        "content": content,
-        "submolt": submolt,
-    }
-    
-    last_error: Exception | None = None
-
-    for attempt in range(1, attempts + 1):
-        try:
-            response = requests.post(
-                POST_ENDPOINT,
-                headers=headers,
-                json=payload,
-                timeout=30,
-            )
-            if response.status_code == 429:
-                retry_after = None
-                try:
-                    payload = response.json()
-                    retry_after = (
-                        payload.get("retry_after_minutes")
-                        or payload.get("retry_after_seconds")
-                        or payload.get("retry_after")
-                    )
-                except ValueError:
-                    payload = None
-
-                print("")
-                print("⏳ Rate limited by Moltbook (HTTP 429).")
-                if retry_after:
-                    print(f"   Retry after: {retry_after}")
-                if response.text and not payload:
-                    print(f"   Response: {response.text}")
-                raise RateLimitError("Rate limited by Moltbook.", retry_after=retry_after)
-
-            if response.status_code >= 400:
-                # Provide context to help diagnose server errors.
-                print("")
-                print(f"❌ HTTP Error: {response.status_code} {response.reason}")
-                if response.text:
-                    print(f"   Response: {response.text}")
-                else:
-                    print("   Response: No response")
-                response.raise_for_status()
-
-            return response.json()
-        except requests.exceptions.RequestException as e:
-            last_error = e
-            if attempt < attempts:
-                delay = base_delay_seconds * attempt
-                print("")
-                print(f"⚠️  Request failed (attempt {attempt}/{attempts}). Retrying in {delay:.1f}s...")
-                time.sleep(delay)
-            else:
-                raise
-
-    # Defensive fallback (should never hit)
-    if last_error:
-        raise last_error
-    raise RuntimeError("Unknown error posting to Moltbook.")
-
-
 def main():
     print("")
     print("🦞 MoltInTheMist Announcement Poster")
@@ -197,7 +88,7 @@ def main():
     
     # Load content
     api_key = load_api_key()
-    content = load_post_content()
+    content = load_markdown_stripped(CONTENT_FILE)
     
     # Show preview
     preview_post(POST_TITLE, content, POST_SUBMOLT)
@@ -238,10 +129,10 @@ def main():
             print("")
             print(f"🔗 View your post: https://www.moltbook.com/post/{post_id}")
     
-    except requests.exceptions.HTTPError as e:
+    except httpx.HTTPStatusError as e:
         print("")
         print(f"❌ HTTP Error: {e}")
-        print(f"   Response: {e.response.text if e.response else 'No response'}")
+        print(f"   Response: {e.response.text or 'No response'}")
         sys.exit(1)
 
     except RateLimitError as e:
@@ -251,7 +142,7 @@ def main():
             print(f"   Suggested wait: {e.retry_after}")
         sys.exit(1)
     
-    except requests.exceptions.RequestException as e:
+    except httpx.HTTPError as e:
         print("")
         print(f"❌ Request Error: {e}")
         sys.exit(1)
@@ -0,0 +1,71 @@
+"""Tests for the posting scripts' TokenBucketRateLimiter."""
+
+import sys
+import unittest
+from pathlib import Path
+from unittest import mock
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import _common  # noqa: E402
+from _common import TokenBucketRateLimiter  # noqa: E402
+
+
+class FakeClock:
+    """Stands in for time.monotonic/time.sleep so tests don't wait."""
+
+    def __init__(self):
+        self.now = 1000.0
+
+    def monotonic(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float) -> None:
+        self.now += seconds
+
+
+class TokenBucketRateLimiterTest(unittest.TestCase):
+    def setUp(self):
+        self.clock = FakeClock()
+        patcher = mock.patch.multiple(
+            _common.time, monotonic=self.clock.monotonic, sleep=self.clock.sleep
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.limiter = TokenBucketRateLimiter(90, 90, 60.0)
+
+    def test_refills_after_interval(self):
+        for _ in range(90):
+            self.limiter.acquire()
+        self.assertEqual(self.limiter.remaining, 0)
+        self.clock.now += 60
+        self.assertEqual(self.limiter.remaining, 90)
+
+    def test_holds_remaining_until_reset_longer_than_interval(self):
+        self.limiter.update_from_headers(
+            {"X-RateLimit-Remaining": "0", "X-RateLimit-Reset": "600"}
+        )
+        self.clock.now += 61
+        self.assertEqual(self.limiter.remaining, 0)
+        self.clock.now += 538
+        self.assertEqual(self.limiter.remaining, 0)
+        self.clock.now += 1
+        self.assertEqual(self.limiter.remaining, 90)
+
+    def test_acquire_waits_out_the_reset(self):
+        start = self.clock.now
+        self.limiter.update_from_headers(
+            {"X-RateLimit-Remaining": "0", "X-RateLimit-Reset": "600"}
+        )
+        self.limiter.acquire()
+        self.assertGreaterEqual(self.clock.now - start, 600)
+
+    def test_ignores_higher_remaining(self):
+        self.limiter.update_from_headers(
+            {"X-RateLimit-Remaining": "500", "X-RateLimit-Reset": "600"}
+        )
+        self.assertEqual(self.limiter.remaining, 90)
+
+
+if __name__ == "__main__":
+    unittest.main()
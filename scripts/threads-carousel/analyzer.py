@@ -4,13 +4,40 @@ Data Analyzer Module
 Reads Moltbook JSON data and computes insights for carousel posts.
 """
 
+import hashlib
 import json
+import os
+import pickle
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any
 
+try:
+    import orjson
+except ImportError:  # orjson is optional; fall back to the stdlib parser
+    orjson = None
 
-@dataclass
+# Bump when AnalysisResult or the derivation logic changes to invalidate caches
+ANALYSIS_CACHE_VERSION = 2
+
+
+def default_cache_dir() -> Path:
+    """Per-user analysis cache directory, following XDG_CACHE_HOME."""
+    cache_home = os.environ.get("XDG_CACHE_HOME")
+    return (Path(cache_home) if cache_home else Path.home() / ".cache") / "molt-in-the-mist"
+
+
+def _read_json(path: Path) -> Any:
+    """Parse a JSON file, using orjson on the raw bytes when available."""
+    if orjson is not None:
+        return orjson.loads(path.read_bytes())
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+@dataclass(slots=True, frozen=True)
 class LeaderboardEntry:
     """A single leaderboard entry."""
     name: str
@@ -18,7 +45,7 @@ class LeaderboardEntry:
     rank: int
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class TopPost:
     """A top-performing post."""
     id: str
@@ -27,7 +54,7 @@ class TopPost:
     upvotes: int
 
 
-@dataclass
+@dataclass(slots=True)
 class NetworkStats:
     """Network-level statistics."""
     total_agents: int = 0
@@ -42,7 +69,7 @@ class NetworkStats:
     collected_at: str = ""
 
 
-@dataclass
+@dataclass(slots=True)
 class CommunityInfo:
     """Community information."""
     id: int
@@ -51,7 +78,7 @@ class CommunityInfo:
     top_agents: list[str] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True)
 class AnalysisResult:
     """Complete analysis result for carousel generation."""
     leaderboard: list[LeaderboardEntry]
@@ -64,6 +91,7 @@ class AnalysisResult:
     avg_karma_top10: float = 0.0
     top_author_posts: str = ""
     top_author_post_count: int = 0
+    unique_top_authors: int = 0
     
     def headline_stat(self) -> str:
         """Generate a compelling headline stat."""
@@ -88,8 +116,13 @@ class AnalysisResult:
 class DataAnalyzer:
     """Analyzes Moltbook data from JSON files."""
     
-    def __init__(self, data_dir: Path | None = None):
-        """Initialize with data directory path."""
+    def __init__(
+        self,
+        data_dir: Path | None = None,
+        cache_dir: Path | None = None,
+        use_cache: bool = True,
+    ):
+        """Initialize with data directory path and analysis cache settings."""
         if data_dir is None:
             # Default to project's data directory
             self.data_dir = Path(__file__).parent.parent.parent / "data"
@@ -100,12 +133,91 @@ class DataAnalyzer:
             Path(__file__).parent.parent.parent 
             / "packages" / "site" / "public" / "data"
         )
+        
+        self.leaderboard_path = self.data_dir / "moltbook-leaderboard.json"
+        self.top_posts_path = self.data_dir / "moltbook-top-posts.json"
+        self.vis_path = self.site_data_dir / "visualization.json"
+        
+        # Only look up the home directory when the cache will actually be used
+        self.cache_dir: Path | None = Path(cache_dir) if cache_dir else None
+        if use_cache and self.cache_dir is None:
+            try:
+                self.cache_dir = default_cache_dir()
+            except RuntimeError:
+                use_cache = False  # No home directory; caching is best-effort
+        self.use_cache = use_cache
     
     def analyze(self) -> AnalysisResult:
-        """Run full analysis and return results."""
-        leaderboard = self._load_leaderboard()
-        top_posts = self._load_top_posts()
-        network_stats, communities = self._load_visualization_data()
+        """Run full analysis, reusing a cached result if the inputs are unchanged."""
+        cache_path = self._cache_path() if self.use_cache else None
+        
+        if cache_path is not None and cache_path.exists():
+            try:
+                with open(cache_path, "rb") as f:
+                    return pickle.load(f)
+            except Exception:
+                pass  # Stale, corrupt or incompatible cache entry; recompute below
+        
+        result = self._analyze_uncached()
+        
+        if cache_path is not None:
+            try:
+                cache_path.parent.mkdir(parents=True, exist_ok=True)
+                tmp_path = cache_path.with_suffix(".tmp")
+                with open(tmp_path, "wb") as f:
+                    pickle.dump(result, f, protocol=pickle.HIGHEST_PROTOCOL)
+                os.replace(tmp_path, cache_path)
+                self._prune_cache(keep=cache_path)
+            except OSError:
+                pass  # Caching is best-effort
+        
+        return result
+    
+    def _cache_prefix(self) -> str:
+        """Filename prefix shared by every cache entry for this set of inputs."""
+        inputs = "|".join(
+            str(path) for path in (self.leaderboard_path, self.top_posts_path, self.vis_path)
+        )
+        return f"analysis-{hashlib.blake2b(inputs.encode(), digest_size=8).hexdigest()}-"
+    
+    def _prune_cache(self, keep: Path) -> None:
+        """Delete this dataset's older entries so each data revision replaces the last."""
+        prefix = self._cache_prefix()
+        for stale_path in self.cache_dir.glob("analysis-*.pkl"):
+            # Also clear unprefixed entries written before per-dataset prefixes
+            legacy = stale_path.stem.count("-") == 1
+            if stale_path != keep and (legacy or stale_path.name.startswith(prefix)):
+                try:
+                    stale_path.unlink()
+                except OSError:
+                    pass  # Another run may have removed it already
+    
+    def _cache_path(self) -> Path:
+        """Build the cache file path keyed by each input's path, mtime, and size.
+        
+        Entries are prefixed per dataset, so pruning one --data-dir's stale
+        entries leaves other datasets' caches alone.
+        """
+        key = hashlib.blake2b(digest_size=16)
+        key.update(str(ANALYSIS_CACHE_VERSION).encode())
+        for path in (self.leaderboard_path, self.top_posts_path, self.vis_path):
+            try:
+                st = path.stat()
+                key.update(f"|{path}:{st.st_mtime_ns}:{st.st_size}".encode())
+            except FileNotFoundError:
+                key.update(f"|{path}:missing".encode())
+        return self.cache_dir / f"{self._cache_prefix()}{key.hexdigest()}.pkl"
+    
+    def _analyze_uncached(self) -> AnalysisResult:
+        """Load the JSON inputs and compute derived insights."""
+        # The three loaders are independent file reads, so overlap their I/O
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            leaderboard_future = executor.submit(self._load_leaderboard)
+            top_posts_future = executor.submit(self._load_top_posts)
+            vis_future = executor.submit(self._load_visualization_data)
+            leaderboard = leaderboard_future.result()
+            top_posts = top_posts_future.result()
+            network_stats, communities = vis_future.result()
         
         # If network stats are empty, derive from available data
         if network_stats.total_agents == 0 and leaderboard:
@@ -122,17 +234,18 @@ class DataAnalyzer:
         
         # Compute derived insights
         if leaderboard:
-            result.total_karma = sum(e.karma for e in leaderboard)
-            top_10 = leaderboard[:10]
-            result.avg_karma_top10 = (
-                sum(e.karma for e in top_10) / len(top_10) if top_10 else 0
-            )
+            # Flatten karma once so the reductions below run over plain ints
+            karmas = [e.karma for e in leaderboard]
+            result.total_karma = sum(karmas)
+            top_10 = karmas[:10]
+            result.avg_karma_top10 = sum(top_10) / len(top_10)
             
             # Estimate influencers as top 10% or those with karma > average
-            if len(leaderboard) >= 10:
+            if len(karmas) >= 10:
+                avg = result.avg_karma_top10
                 network_stats.influencer_count = max(
-                    len(leaderboard) // 10,
-                    len([e for e in leaderboard if e.karma > result.avg_karma_top10])
+                    len(karmas) // 10,
+                    sum(1 for k in karmas if k > avg),
                 )
             
             # Set top influencer
@@ -141,25 +254,20 @@ class DataAnalyzer:
         
         # Find most prolific author in top posts
         if top_posts:
-            author_counts: dict[str, int] = {}
-            for post in top_posts:
-                author_counts[post.author] = author_counts.get(post.author, 0) + 1
-            if author_counts:
-                top_author = max(author_counts.items(), key=lambda x: x[1])
-                result.top_author_posts = top_author[0]
-                result.top_author_post_count = top_author[1]
+            author_counts = Counter(post.author for post in top_posts)
+            top_author, top_count = author_counts.most_common(1)[0]
+            result.top_author_posts = top_author
+            result.top_author_post_count = top_count
+            result.unique_top_authors = len(author_counts)
         
         return result
     
     def _load_leaderboard(self) -> list[LeaderboardEntry]:
         """Load leaderboard data."""
-        leaderboard_path = self.data_dir / "moltbook-leaderboard.json"
-        
-        if not leaderboard_path.exists():
+        if not self.leaderboard_path.exists():
             return []
         
-        with open(leaderboard_path, "r", encoding="utf-8") as f:
-            data = json.load(f)
+        data = _read_json(self.leaderboard_path)
         
         return [
             LeaderboardEntry(
@@ -172,13 +280,10 @@ class DataAnalyzer:
     
     def _load_top_posts(self) -> list[TopPost]:
         """Load top posts data."""
-        top_posts_path = self.data_dir / "moltbook-top-posts.json"
-        
-        if not top_posts_path.exists():
+        if not self.top_posts_path.exists():
             return []
         
-        with open(top_posts_path, "r", encoding="utf-8") as f:
-            data = json.load(f)
+        data = _read_json(self.top_posts_path)
         
         return [
             TopPost(
@@ -192,16 +297,13 @@ class DataAnalyzer:
     
     def _load_visualization_data(self) -> tuple[NetworkStats, list[CommunityInfo]]:
         """Load visualization data for network stats."""
-        vis_path = self.site_data_dir / "visualization.json"
-        
         stats = NetworkStats()
         communities: list[CommunityInfo] = []
         
-        if not vis_path.exists():
+        if not self.vis_path.exists():
             return stats, communities
         
-        with open(vis_path, "r", encoding="utf-8") as f:
-            data = json.load(f)
+        data = _read_json(self.vis_path)
         
         # Extract metadata
         metadata = data.get("metadata", {})
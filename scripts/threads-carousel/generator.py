@@ -21,10 +21,6 @@ _package_dir = Path(__file__).parent
 if str(_package_dir) not in sys.path:
     sys.path.insert(0, str(_package_dir))
 
-from analyzer import DataAnalyzer
-from images import ImageGenerator, IMAGE_SIZES
-from templates import MarkdownGenerator
-
 # Platforms to generate
 PLATFORMS = ["threads", "linkedin"]
 
@@ -88,6 +84,21 @@ Examples:
         help="Skip image generation (useful for testing markdown only)",
     )
     
+    parser.add_argument(
+        "--png-compress-level",
+        type=int,
+        choices=range(10),
+        default=1,
+        metavar="0-9",
+        help="PNG zlib level: 0 is fastest (previews), 9 is smallest (default: 1)",
+    )
+    
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Ignore the cached analysis and re-read the JSON data",
+    )
+    
     parser.add_argument(
         "--verbose",
         "-v",
@@ -97,6 +108,11 @@ Examples:
     
     args = parser.parse_args()
     
+    # Deferred so --help and argument errors don't pay for Pillow/requests
+    from analyzer import DataAnalyzer
+    from images import IMAGE_SIZES, ImageGenerator
+    from templates import MarkdownGenerator
+    
     print()
     print("🦞 Molt in the Mist — Social Carousel Generator")
     print("=" * 50)
@@ -114,24 +130,25 @@ Examples:
             / timestamp_str
         )
     
-    output_base.mkdir(parents=True, exist_ok=True)
+    # Directories are created just before their first write, so a failed
+    # analysis step doesn't leave an empty output folder behind.
     print(f"📁 Output directory: {output_base}")
     print()
     
     # Determine which platforms to generate
     platforms_to_generate = PLATFORMS if args.platform == "all" else [args.platform]
+    platform_sizes = {p: IMAGE_SIZES[p] for p in platforms_to_generate}
     
     # Display platform info
     print(f"📱 Platforms: {', '.join(platforms_to_generate)}")
-    for platform in platforms_to_generate:
-        size = IMAGE_SIZES[platform]
+    for platform, size in platform_sizes.items():
         print(f"   {platform}: {size[0]}×{size[1]} px")
     print()
     
     # Step 1: Analyze data
     print("📊 Analyzing Moltbook data...")
     data_dir = Path(args.data_dir) if args.data_dir else None
-    analyzer = DataAnalyzer(data_dir=data_dir)
+    analyzer = DataAnalyzer(data_dir=data_dir, use_cache=not args.no_cache)
     
     try:
         analysis = analyzer.analyze()
@@ -162,17 +179,18 @@ Examples:
     if not args.skip_images:
         print("🎨 Generating carousel images...")
         
-        for platform in platforms_to_generate:
-            platform_dir = output_base / platform
-            platform_dir.mkdir(parents=True, exist_ok=True)
-            
-            size = IMAGE_SIZES[platform]
+        # Rendered in turn: a spawned worker takes longer to start than a
+        # platform's whole carousel takes to render in-process
+        for platform, size in platform_sizes.items():
             print(f"\n   📐 {platform.upper()} ({size[0]}×{size[1]}):")
             
-            image_gen = ImageGenerator(platform=platform)
-            
             try:
-                image_paths = image_gen.generate_all(analysis, platform_dir)
+                image_gen = ImageGenerator(
+                    platform=platform,
+                    size=size,
+                    compress_level=args.png_compress_level,
+                )
+                image_paths = image_gen.generate_all(analysis, output_base / platform)
                 all_image_paths[platform] = image_paths
                 print(f"      ✓ Generated {len(image_paths)} images")
             except Exception as e:
@@ -204,7 +222,7 @@ Examples:
     
     for platform, image_paths in all_image_paths.items():
         platform_dir = output_base / platform
-        size = IMAGE_SIZES.get(platform, IMAGE_SIZES["threads"])
+        platform_dir.mkdir(parents=True, exist_ok=True)
         
         try:
             md_path = md_gen.generate(
@@ -226,12 +244,14 @@ Examples:
     print("📂 Output structure:")
     print(f"   {output_base}/")
     
-    for platform in platforms_to_generate:
-        size = IMAGE_SIZES[platform]
+    # Every listed path was just written unless image generation was skipped
+    # (a failed platform exits early), so there is no need to stat each file.
+    exists = "○" if args.skip_images else "✓"
+    
+    for platform, size in platform_sizes.items():
         print(f"   └── {platform}/ ({size[0]}×{size[1]})")
         if platform in all_image_paths:
             for path in all_image_paths[platform][:3]:
-                exists = "✓" if path.exists() else "○"
                 print(f"       {exists} {path.name}")
             if len(all_image_paths[platform]) > 3:
                 print(f"       ... and {len(all_image_paths[platform]) - 3} more")
@@ -6,9 +6,13 @@ matching the Molt in the Mist site aesthetic.
 """
 
 import io
+import math
 import os
 import sys
-from dataclasses import dataclass
+from dataclasses import dataclass, fields
+from datetime import datetime
+from functools import lru_cache
+from itertools import accumulate
 from pathlib import Path
 from typing import Literal
 
@@ -56,12 +60,122 @@ IMAGE_SIZES = {
 DEFAULT_PADDING = 80
 
 
+@lru_cache(maxsize=None)
 def hex_to_rgb(hex_color: str) -> tuple[int, int, int]:
-    """Convert hex color to RGB tuple."""
+    """Convert hex color to RGB tuple (cached; inputs are a small fixed set)."""
     hex_color = hex_color.lstrip("#")
     return tuple(int(hex_color[i:i+2], 16) for i in (0, 2, 4))  # type: ignore
 
 
+@dataclass(frozen=True, slots=True)
+class RGBPalette:
+    """ColorPalette pre-converted to RGB tuples for Pillow fills."""
+    bg_paper: tuple[int, int, int]
+    bg_surface: tuple[int, int, int]
+    bg_inset: tuple[int, int, int]
+    border: tuple[int, int, int]
+    border_strong: tuple[int, int, int]
+    
+    text_primary: tuple[int, int, int]
+    text_secondary: tuple[int, int, int]
+    text_tertiary: tuple[int, int, int]
+    text_inverted: tuple[int, int, int]
+    
+    accent_signal: tuple[int, int, int]
+    accent_warm: tuple[int, int, int]
+    accent_deep: tuple[int, int, int]
+    wayfinding: tuple[int, int, int]
+    
+    @classmethod
+    def from_palette(cls, palette: ColorPalette) -> "RGBPalette":
+        """Parse every hex color in a ColorPalette once."""
+        return cls(**{f.name: hex_to_rgb(getattr(palette, f.name)) for f in fields(palette)})
+
+
+RGB = RGBPalette.from_palette(COLORS)
+
+
+@lru_cache(maxsize=4096)
+def _fmt_k(n: int) -> str:
+    """Format a count with thousands separators (cached; cards repeat values)."""
+    return f"{n:,}"
+
+
+def _ring_offsets() -> tuple[tuple[int, int], ...]:
+    """(dx, dy) of leaderboard ranks 2-15 around the overview's center node.
+    
+    Ranks sit on rings of 3, 5 and 7 nodes at radii 40, 90 and 140, each
+    ring rotated a further 0.3 rad.
+    """
+    offsets = []
+    for i in range(1, 15):
+        ring = 0 if i < 3 else (1 if i < 8 else 2)
+        radius = 40 + ring * 50
+        angle = (i - (0 if ring == 0 else (3 if ring == 1 else 8))) * (2 * math.pi / (3 if ring == 0 else (5 if ring == 1 else 7)))
+        angle += ring * 0.3  # Offset each ring
+        offsets.append((int(radius * math.cos(angle)), int(radius * math.sin(angle))))
+    return tuple(offsets)
+
+
+# The network layout never changes, so its trig runs once at import
+_RING_OFFSETS = _ring_offsets()
+
+
+@lru_cache(maxsize=None)
+def _disc_mask(radius: int) -> Image.Image:
+    """Mask of the disc draw.ellipse fills for a (2r+1)-pixel-wide box."""
+    mask = Image.new("L", (2 * radius + 1, 2 * radius + 1), 0)
+    ImageDraw.Draw(mask).ellipse([(0, 0), (2 * radius, 2 * radius)], fill=255)
+    return mask
+
+
+def _paste_disc(img: Image.Image, cx: int, cy: int, radius: int, fill: tuple[int, int, int]):
+    """Stamp a filled disc centered on (cx, cy) from the cached mask."""
+    img.paste(fill, (cx - radius, cy - radius), _disc_mask(radius))
+
+
+@lru_cache(maxsize=256)
+def _wrap_text(text: str, font: ImageFont.FreeTypeFont, max_width: int) -> tuple[str, ...]:
+    """Greedy word wrap to max_width, cached per (text, font, width).
+    
+    Each word is measured once and line widths are accumulated from the
+    word and space advances, rather than re-measuring the growing line.
+    An over-wide single word still gets a line of its own.
+    
+    Fit is judged on advance width, not the ink bbox, so a line whose last
+    glyph overhangs its advance can run a pixel or two past max_width.
+    """
+    space_width = font.getlength(" ")
+    lines = []
+    current: list[str] = []
+    current_width = 0.0
+    
+    for word in text.split():
+        word_width = font.getlength(word)
+        if current and current_width + space_width + word_width > max_width:
+            lines.append(" ".join(current))
+            current = []
+        if current:
+            current_width += space_width + word_width
+        else:
+            current_width = word_width
+        current.append(word)
+    
+    if current:
+        lines.append(" ".join(current))
+    
+    return tuple(lines)
+
+
+def _fill_rect(img: Image.Image, x0: int, y0: int, x1: int, y1: int, fill: tuple[int, int, int]):
+    """Fill a solid rectangle, corners inclusive like ImageDraw.rectangle.
+    
+    Pasting a color is a straight block fill, skipping the shape
+    rasterizer that draw.rectangle goes through.
+    """
+    img.paste(fill, (x0, y0, x1 + 1, y1 + 1))
+
+
 class FontManager:
     """Manages font loading and caching.
     
@@ -99,11 +213,16 @@ class FontManager:
             self.cache_dir = cache_dir
         self.cache_dir.mkdir(parents=True, exist_ok=True)
         self._fonts: dict[str, Path] = {}
+        self._font_cache: dict[tuple[str, int], ImageFont.FreeTypeFont] = {}
     
     def get_font(self, name: str, size: int) -> ImageFont.FreeTypeFont:
-        """Get a font at the specified size."""
-        font_path = self._ensure_font(name)
-        return ImageFont.truetype(str(font_path), size)
+        """Get a font at the specified size, parsing each (name, size) only once."""
+        key = (name, size)
+        font = self._font_cache.get(key)
+        if font is None:
+            font = ImageFont.truetype(str(self._ensure_font(name)), size)
+            self._font_cache[key] = font
+        return font
     
     def _ensure_font(self, name: str) -> Path:
         """Ensure font is available and return path."""
@@ -134,8 +253,10 @@ class FontManager:
             except Exception as e:
                 print(f"Warning: Could not download font {name}: {e}")
         
-        # Fallback to system font
-        return self._get_fallback_font()
+        # Fallback to system font (remembered so later sizes skip the probes)
+        fallback = self._get_fallback_font()
+        self._fonts[name] = fallback
+        return fallback
     
     def _get_fallback_font(self) -> Path:
         """Get a fallback system font path."""
@@ -155,41 +276,81 @@ class FontManager:
 class ImageGenerator:
     """Generates carousel images with editorial styling."""
     
-    def __init__(self, platform: str = "threads"):
+    # Every (font, size) the cards draw with; loaded up front in __init__
+    FONT_SPECS: tuple[tuple[str, int], ...] = (
+        ("DMSans-Bold", 11), ("DMSans-Bold", 12), ("DMSans-Bold", 14),
+        ("DMSans-Bold", 16), ("DMSans-Bold", 20), ("DMSans-Bold", 24),
+        ("DMSans-Bold", 28),
+        ("DMSans-Medium", 10), ("DMSans-Medium", 11), ("DMSans-Medium", 14),
+        ("DMSans-Medium", 16), ("DMSans-Medium", 18), ("DMSans-Medium", 20),
+        ("DMSans-Medium", 22), ("DMSans-Medium", 24), ("DMSans-Medium", 32),
+        ("DMSans-Regular", 18), ("DMSans-Regular", 20),
+        ("LibreBaskerville-Bold", 32), ("LibreBaskerville-Bold", 36),
+        ("LibreBaskerville-Bold", 38), ("LibreBaskerville-Bold", 48),
+        ("LibreBaskerville-Bold", 64), ("LibreBaskerville-Bold", 72),
+        ("LibreBaskerville-Bold", 96), ("LibreBaskerville-Bold", 120),
+        ("LibreBaskerville-Regular", 32), ("LibreBaskerville-Regular", 42),
+        ("LibreBaskerville-Regular", 48),
+    )
+    
+    def __init__(
+        self,
+        platform: str = "threads",
+        size: tuple[int, int] | None = None,
+        compress_level: int = 1,
+    ):
         """Initialize the image generator.
         
         Args:
             platform: Target platform ("threads" or "linkedin")
+            size: Explicit (width, height) canvas; defaults to the platform's size
+            compress_level: PNG zlib level (0 = store, fastest; 9 = smallest)
         """
         self.fonts = FontManager()
         self.colors = COLORS
+        self.rgb = RGB  # self.colors as RGB tuples
         self.platform = platform
-        self.image_size = IMAGE_SIZES.get(platform, IMAGE_SIZES["threads"])
+        self.image_size = size or IMAGE_SIZES.get(platform, IMAGE_SIZES["threads"])
         self.padding = DEFAULT_PADDING
         self.inner_width = self.image_size[0] - (self.padding * 2)
+        self.compress_level = compress_level
+        # Parse every font up front so no card pays for it mid-render
+        for font_name, font_size in self.FONT_SPECS:
+            self.fonts.get_font(font_name, font_size)
+        # Masthead and footer are identical on every card: render them once
+        self._masthead_tile = self._render_masthead_tile()
+        self._footer_tile = self._render_footer_tile()
+        # Paper + masthead (including the date) per timestamp, copied by each card
+        self._masthead_templates: dict[str, Image.Image] = {}
     
     def generate_all(self, analysis: AnalysisResult, output_dir: Path) -> list[Path]:
         """Generate all carousel images and return their paths."""
         output_dir.mkdir(parents=True, exist_ok=True)
         
-        images = [
+        # Stamp every card with the same date
+        timestamp = datetime.now().strftime("%b %d, %Y")
+        
+        cards = [
             # Narrative intro slides (zoom in progression)
-            ("01-narrative.png", self._create_narrative_card(analysis)),
-            ("02-overview.png", self._create_overview_card(analysis)),
-            ("03-power-map.png", self._create_power_map_card(analysis)),
+            ("01-narrative.png", self._create_narrative_card),
+            ("02-overview.png", self._create_overview_card),
+            ("03-power-map.png", self._create_power_map_card),
             # Detailed data slides
-            ("04-hero.png", self._create_hero_card(analysis)),
-            ("05-leaderboard.png", self._create_leaderboard_card(analysis)),
-            ("06-network.png", self._create_network_stats_card(analysis)),
-            ("07-top-post.png", self._create_top_post_card(analysis)),
+            ("04-hero.png", self._create_hero_card),
+            ("05-leaderboard.png", self._create_leaderboard_card),
+            ("06-network.png", self._create_network_stats_card),
+            ("07-top-post.png", self._create_top_post_card),
             # Final CTA slide
-            ("08-cta.png", self._create_cta_card(analysis)),
+            ("08-cta.png", self._create_cta_card),
         ]
         
         paths = []
-        for filename, img in images:
+        for filename, create_card in cards:
             path = output_dir / filename
-            img.save(path, "PNG", quality=95)
+            # Social platforms re-encode uploads, so favor encode speed over size
+            create_card(analysis, timestamp).save(
+                path, "PNG", compress_level=self.compress_level, optimize=False
+            )
             paths.append(path)
             print(f"  Created: {path}")
         
@@ -197,37 +358,52 @@ class ImageGenerator:
     
     def _create_base_image(self) -> tuple[Image.Image, ImageDraw.ImageDraw]:
         """Create a base image with background."""
-        img = Image.new("RGB", self.image_size, hex_to_rgb(self.colors.bg_paper))
+        img = Image.new("RGB", self.image_size, self.rgb.bg_paper)
         draw = ImageDraw.Draw(img)
         return img, draw
     
-    def _draw_masthead(self, draw: ImageDraw.ImageDraw, y: int | None = None, timestamp: str = "") -> int:
-        if y is None:
-            y = self.padding
-        """Draw the masthead header and return the new y position."""
-        # Title - Data source attribution
+    def _create_masthead_image(self, timestamp: str) -> tuple[Image.Image, ImageDraw.ImageDraw, int]:
+        """Copy a base image that already carries the masthead.
+        
+        The template is drawn once per timestamp; returns the copy, a draw
+        handle for it, and the y position below the masthead.
+        """
+        template = self._masthead_templates.get(timestamp)
+        if template is None:
+            template, draw = self._create_base_image()
+            self._draw_masthead(template, draw, timestamp)
+            self._masthead_templates[timestamp] = template
+        img = template.copy()
+        return img, ImageDraw.Draw(img), self._masthead_tile.height
+    
+    def _draw_masthead(self, img: Image.Image, draw: ImageDraw.ImageDraw, timestamp: str):
+        """Draw the masthead header with the timestamp."""
+        img.paste(self._masthead_tile, (0, 0))
+        
+        # Timestamp on the right (the only part that isn't pre-rendered)
         source_font = self.fonts.get_font("DMSans-Medium", 14)
+        bbox = draw.textbbox((0, 0), timestamp, font=source_font)
+        ts_width = bbox[2] - bbox[0]
         draw.text(
-            (self.padding, y),
-            "DATA FROM MOLTBOOK",
+            (self.image_size[0] - self.padding - ts_width, self.padding),
+            timestamp,
             font=source_font,
-            fill=hex_to_rgb(self.colors.text_tertiary),
+            fill=self.rgb.text_tertiary,
         )
+    
+    def _render_masthead_tile(self) -> Image.Image:
+        """Render the static masthead once; cards paste it at the top."""
+        tile = Image.new("RGB", self.image_size, self.rgb.bg_paper)
+        draw = ImageDraw.Draw(tile)
+        y = self.padding
         
-        # Timestamp on the right
-        if timestamp:
-            ts_text = timestamp
-        else:
-            from datetime import datetime
-            ts_text = datetime.now().strftime("%b %d, %Y")
-        
-        bbox = draw.textbbox((0, 0), ts_text, font=source_font)
-        ts_width = bbox[2] - bbox[0]
+        # Title - Data source attribution
+        source_font = self.fonts.get_font("DMSans-Medium", 14)
         draw.text(
-            (self.image_size[0] - self.padding - ts_width, y),
-            ts_text,
+            (self.padding, y),
+            "DATA FROM MOLTBOOK",
             font=source_font,
-            fill=hex_to_rgb(self.colors.text_tertiary),
+            fill=self.rgb.text_tertiary,
         )
         
         # Main title
@@ -237,15 +413,12 @@ class ImageGenerator:
             (self.padding, y),
             "MOLT IN THE MIST",
             font=title_font,
-            fill=hex_to_rgb(self.colors.text_primary),
+            fill=self.rgb.text_primary,
         )
         
         # Accent rule
         y += 55
-        draw.rectangle(
-            [(self.padding, y), (self.padding + 80, y + 4)],
-            fill=hex_to_rgb(self.colors.accent_signal),
-        )
+        _fill_rect(tile, self.padding, y, self.padding + 80, y + 4, self.rgb.accent_signal)
         
         # Tagline
         y += 18
@@ -254,21 +427,42 @@ class ImageGenerator:
             (self.padding, y),
             "NETWORK INFLUENCE ANALYSIS",
             font=tagline_font,
-            fill=hex_to_rgb(self.colors.text_secondary),
+            fill=self.rgb.text_secondary,
         )
         
-        return y + 45
+        # The tile's height doubles as the y position cards continue from
+        return tile.crop((0, 0, self.image_size[0], y + 45))
+    
+    def _draw_section_marker(
+        self, img: Image.Image, draw: ImageDraw.ImageDraw, y: int, number: str, label: str
+    ):
+        """Draw a numbered section marker (black box with number, then label)."""
+        marker_font = self.fonts.get_font("DMSans-Bold", 14)
+        _fill_rect(img, self.padding, y, self.padding + 30, y + 24, self.rgb.wayfinding)
+        draw.text(
+            (self.padding + 8, y + 4),
+            number,
+            font=marker_font,
+            fill=self.rgb.text_inverted,
+        )
+        draw.text(
+            (self.padding + 45, y + 4),
+            label,
+            font=marker_font,
+            fill=self.rgb.text_primary,
+        )
     
-    def _draw_footer(self, draw: ImageDraw.ImageDraw):
+    def _draw_footer(self, img: Image.Image):
         """Draw the footer bar."""
+        img.paste(self._footer_tile, (0, self.image_size[1] - self._footer_tile.height))
+    
+    def _render_footer_tile(self) -> Image.Image:
+        """Render the footer bar once; cards paste it at the bottom."""
         footer_height = 50
-        footer_y = self.image_size[1] - footer_height
         
         # Black footer bar
-        draw.rectangle(
-            [(0, footer_y), (self.image_size[0], self.image_size[1])],
-            fill=hex_to_rgb(self.colors.wayfinding),
-        )
+        tile = Image.new("RGB", (self.image_size[0], footer_height), self.rgb.wayfinding)
+        draw = ImageDraw.Draw(tile)
         
         # Single line: "Generated by Molt in the Mist  ·  github.com/busse/molt-in-the-mist"
         tool_font = self.fonts.get_font("DMSans-Medium", 14)
@@ -282,14 +476,14 @@ class ImageGenerator:
         bbox = draw.textbbox((0, 0), full_text, font=tool_font)
         text_width = bbox[2] - bbox[0]
         x = (self.image_size[0] - text_width) // 2
-        text_y = footer_y + (footer_height - (bbox[3] - bbox[1])) // 2
+        text_y = (footer_height - (bbox[3] - bbox[1])) // 2
         
         # Draw label part
         draw.text(
             (x, text_y),
             label_text,
             font=tool_font,
-            fill=hex_to_rgb(self.colors.text_inverted),
+            fill=self.rgb.text_inverted,
         )
         
         # Draw separator
@@ -299,7 +493,7 @@ class ImageGenerator:
             (sep_x, text_y),
             separator,
             font=tool_font,
-            fill=hex_to_rgb(self.colors.text_tertiary),
+            fill=self.rgb.text_tertiary,
         )
         
         # Draw URL
@@ -309,13 +503,14 @@ class ImageGenerator:
             (url_x, text_y),
             url_text,
             font=tool_font,
-            fill=hex_to_rgb(self.colors.text_inverted),
+            fill=self.rgb.text_inverted,
         )
+        
+        return tile
     
-    def _create_narrative_card(self, analysis: AnalysisResult) -> Image.Image:
+    def _create_narrative_card(self, analysis: AnalysisResult, timestamp: str) -> Image.Image:
         """Create the opening narrative hook card."""
-        img, draw = self._create_base_image()
-        y = self._draw_masthead(draw)
+        img, draw, y = self._create_masthead_image(timestamp)
         
         # Large narrative text
         y += 80
@@ -332,7 +527,7 @@ class ImageGenerator:
                 "Moltbook.",
                 "",
                 f"{len(analysis.leaderboard)} agents.",
-                f"{analysis.total_karma:,} karma.",
+                f"{_fmt_k(analysis.total_karma)} karma.",
                 f"{len(analysis.top_posts)} posts analyzed.",
                 "",
                 "Here's what I found.",
@@ -359,69 +554,58 @@ class ImageGenerator:
             # First two lines are large serif
             if i < 2:
                 font = serif_large
-                color = self.colors.text_primary
+                color = self.rgb.text_primary
             # Numbers/stats get accent color
             elif any(char.isdigit() for char in line):
                 font = sans_medium
-                color = self.colors.accent_signal
+                color = self.rgb.accent_signal
             # "Here's what I found" is italic-style
             elif "found" in line.lower() or "here" in line.lower():
                 font = serif_medium
-                color = self.colors.text_secondary
+                color = self.rgb.text_secondary
             else:
                 font = sans_medium
-                color = self.colors.text_secondary
+                color = self.rgb.text_secondary
             
             draw.text(
                 (self.padding, y),
                 line,
                 font=font,
-                fill=hex_to_rgb(color),
+                fill=color,
             )
             y += 70 if i < 2 else 50
         
-        self._draw_footer(draw)
+        self._draw_footer(img)
         return img
     
-    def _create_overview_card(self, analysis: AnalysisResult) -> Image.Image:
+    def _create_overview_card(self, analysis: AnalysisResult, timestamp: str) -> Image.Image:
         """Create the high-level network overview card with rich visualization."""
-        img, draw = self._create_base_image()
-        y = self._draw_masthead(draw)
+        img, draw, y = self._create_masthead_image(timestamp)
         
         # Section marker
         y += 30
-        marker_font = self.fonts.get_font("DMSans-Bold", 14)
-        draw.rectangle(
-            [(self.padding, y), (self.padding + 30, y + 24)],
-            fill=hex_to_rgb(self.colors.wayfinding),
-        )
-        draw.text(
-            (self.padding + 8, y + 4),
-            "01",
-            font=marker_font,
-            fill=hex_to_rgb(self.colors.text_inverted),
-        )
-        draw.text(
-            (self.padding + 45, y + 4),
-            "THE BIG PICTURE",
-            font=marker_font,
-            fill=hex_to_rgb(self.colors.text_primary),
-        )
+        self._draw_section_marker(img, draw, y, "01", "THE BIG PICTURE")
         
         y += 55
         
+        # Running karma totals by rank: cumulative[k - 1] is the top-k share
+        karmas = [e.karma for e in analysis.leaderboard[:15]]
+        cumulative = list(accumulate(karmas[:10]))
+        top_1 = karmas[0] if karmas else 0
+        top_5 = cumulative[min(len(cumulative), 5) - 1] if cumulative else 0
+        top_10 = cumulative[-1] if cumulative else 0
+        
         # Key insight headline
         headline_font = self.fonts.get_font("LibreBaskerville-Bold", 32)
         
         if analysis.leaderboard:
-            top_5_karma = sum(e.karma for e in analysis.leaderboard[:5])
-            concentration = (top_5_karma / analysis.total_karma * 100) if analysis.total_karma else 0
+            concentration = (top_5 / analysis.total_karma * 100) if analysis.total_karma else 0
             
             draw.text(
                 (self.padding, y),
                 f"The top 5 agents control {concentration:.0f}% of karma",
                 font=headline_font,
-                fill=hex_to_rgb(self.colors.text_primary),
+                fill=self.rgb.text_primary,
             )
         y += 50
         
@@ -437,7 +621,7 @@ class ImageGenerator:
             (left_x, y),
             "KARMA DISTRIBUTION",
             font=section_font,
-            fill=hex_to_rgb(self.colors.text_tertiary),
+            fill=self.rgb.text_tertiary,
         )
         
         y += 30
@@ -445,16 +629,13 @@ class ImageGenerator:
         if analysis.leaderboard:
             # Calculate tier breakdowns
             total = analysis.total_karma
-            top_1 = analysis.leaderboard[0].karma
-            top_5 = sum(e.karma for e in analysis.leaderboard[:5])
-            top_10 = sum(e.karma for e in analysis.leaderboard[:10])
             rest = total - top_10
             
             tiers = [
-                ("#1", top_1, self.colors.accent_signal),
-                ("#2-5", top_5 - top_1, self.colors.accent_warm),
-                ("#6-10", top_10 - top_5, self.colors.accent_deep),
-                ("Others", rest, self.colors.border),
+                ("#1", top_1, self.rgb.accent_signal),
+                ("#2-5", top_5 - top_1, self.rgb.accent_warm),
+                ("#6-10", top_10 - top_5, self.rgb.accent_deep),
+                ("Others", rest, self.rgb.border),
             ]
             
             bar_height = 35
@@ -466,10 +647,7 @@ class ImageGenerator:
                 bar_width = int((karma / total) * col_width) if total else 0
                 
                 # Bar
-                draw.rectangle(
-                    [(left_x, y), (left_x + max(bar_width, 4), y + bar_height)],
-                    fill=hex_to_rgb(color),
-                )
+                _fill_rect(img, left_x, y, left_x + max(bar_width, 4), y + bar_height, color)
                 
                 # Label and percentage
                 pct_text = f"{pct:.1f}%"
@@ -477,13 +655,13 @@ class ImageGenerator:
                     (left_x + bar_width + 10, y + 5),
                     pct_text,
                     font=value_font,
-                    fill=hex_to_rgb(self.colors.text_primary),
+                    fill=self.rgb.text_primary,
                 )
                 draw.text(
                     (left_x + bar_width + 10, y + 22),
                     label,
                     font=label_font,
-                    fill=hex_to_rgb(self.colors.text_tertiary),
+                    fill=self.rgb.text_tertiary,
                 )
                 
                 y += bar_height + 15
@@ -494,7 +672,7 @@ class ImageGenerator:
             (right_x, right_y),
             "NETWORK STRUCTURE",
             font=section_font,
-            fill=hex_to_rgb(self.colors.text_tertiary),
+            fill=self.rgb.text_tertiary,
         )
         
         right_y += 30
@@ -502,56 +680,33 @@ class ImageGenerator:
         center_y = right_y + 140
         
         # Draw network nodes at different distances based on rank
-        import math
         if analysis.leaderboard:
-            # Draw connection lines first (behind nodes)
-            for i, entry in enumerate(analysis.leaderboard[:15]):
-                if i == 0:
-                    continue
-                # Position in rings
-                ring = 0 if i < 3 else (1 if i < 8 else 2)
-                radius = 40 + ring * 50
-                angle = (i - (0 if ring == 0 else (3 if ring == 1 else 8))) * (2 * math.pi / (3 if ring == 0 else (5 if ring == 1 else 7)))
-                angle += ring * 0.3  # Offset each ring
+            # Lay out the ring nodes once; lines and nodes both reuse it
+            nodes: list[tuple[int, int, int, tuple[int, int, int]]] = []
+            ranked = zip(_RING_OFFSETS, karmas[1:])
+            for i, ((dx, dy), karma) in enumerate(ranked, start=1):
+                nx = center_x + dx
+                ny = center_y + dy
                 
-                nx = center_x + int(radius * math.cos(angle))
-                ny = center_y + int(radius * math.sin(angle))
-                
-                # Line to center
+                # Node size based on karma
+                node_radius = max(6, min(14, int(karma / top_1 * 14)))
+                color = self.rgb.accent_warm if i < 5 else (self.rgb.accent_deep if i < 10 else self.rgb.text_tertiary)
+                nodes.append((nx, ny, node_radius, color))
+            
+            # Draw connection lines first (behind nodes)
+            for nx, ny, _, _ in nodes:
                 draw.line(
                     [(center_x, center_y), (nx, ny)],
-                    fill=hex_to_rgb(self.colors.border),
+                    fill=self.rgb.border,
                     width=1,
                 )
             
-            # Draw nodes
-            for i, entry in enumerate(analysis.leaderboard[:15]):
-                if i == 0:
-                    # Center node (largest)
-                    node_radius = 20
-                    draw.ellipse(
-                        [(center_x - node_radius, center_y - node_radius),
-                         (center_x + node_radius, center_y + node_radius)],
-                        fill=hex_to_rgb(self.colors.accent_signal),
-                    )
-                else:
-                    ring = 0 if i < 3 else (1 if i < 8 else 2)
-                    radius = 40 + ring * 50
-                    angle = (i - (0 if ring == 0 else (3 if ring == 1 else 8))) * (2 * math.pi / (3 if ring == 0 else (5 if ring == 1 else 7)))
-                    angle += ring * 0.3
-                    
-                    nx = center_x + int(radius * math.cos(angle))
-                    ny = center_y + int(radius * math.sin(angle))
-                    
-                    # Node size based on karma
-                    node_radius = max(6, min(14, int(entry.karma / analysis.leaderboard[0].karma * 14)))
-                    color = self.colors.accent_warm if i < 5 else (self.colors.accent_deep if i < 10 else self.colors.text_tertiary)
-                    
-                    draw.ellipse(
-                        [(nx - node_radius, ny - node_radius),
-                         (nx + node_radius, ny + node_radius)],
-                        fill=hex_to_rgb(color),
-                    )
+            # Center node (largest)
+            node_radius = 20
+            _paste_disc(img, center_x, center_y, node_radius, self.rgb.accent_signal)
+            
+            for nx, ny, node_radius, color in nodes:
+                _paste_disc(img, nx, ny, node_radius, color)
             
             # Center label
             label_font = self.fonts.get_font("DMSans-Bold", 11)
@@ -562,51 +717,34 @@ class ImageGenerator:
                 (center_x - text_width // 2, center_y + 28),
                 name,
                 font=label_font,
-                fill=hex_to_rgb(self.colors.text_primary),
+                fill=self.rgb.text_primary,
             )
         
         # Legend at bottom right
         legend_y = self.image_size[1] - 160
         legend_font = self.fonts.get_font("DMSans-Medium", 10)
         legend_items = [
-            (self.colors.accent_signal, "Elite (#1)"),
-            (self.colors.accent_warm, "Top 5"),
-            (self.colors.accent_deep, "Top 10"),
-            (self.colors.text_tertiary, "Rising"),
+            (self.rgb.accent_signal, "Elite (#1)"),
+            (self.rgb.accent_warm, "Top 5"),
+            (self.rgb.accent_deep, "Top 10"),
+            (self.rgb.text_tertiary, "Rising"),
         ]
         
         for i, (color, label) in enumerate(legend_items):
             lx = right_x + (i * 100)
-            draw.ellipse([(lx, legend_y), (lx + 10, legend_y + 10)], fill=hex_to_rgb(color))
-            draw.text((lx + 16, legend_y - 1), label, font=legend_font, fill=hex_to_rgb(self.colors.text_secondary))
+            _paste_disc(img, lx + 5, legend_y + 5, 5, color)
+            draw.text((lx + 16, legend_y - 1), label, font=legend_font, fill=self.rgb.text_secondary)
         
-        self._draw_footer(draw)
+        self._draw_footer(img)
         return img
     
-    def _create_power_map_card(self, analysis: AnalysisResult) -> Image.Image:
+    def _create_power_map_card(self, analysis: AnalysisResult, timestamp: str) -> Image.Image:
         """Create the power dynamics card showing key players."""
-        img, draw = self._create_base_image()
-        y = self._draw_masthead(draw)
+        img, draw, y = self._create_masthead_image(timestamp)
         
         # Section marker
         y += 40
-        marker_font = self.fonts.get_font("DMSans-Bold", 14)
-        draw.rectangle(
-            [(self.padding, y), (self.padding + 30, y + 24)],
-            fill=hex_to_rgb(self.colors.wayfinding),
-        )
-        draw.text(
-            (self.padding + 8, y + 4),
-            "02",
-            font=marker_font,
-            fill=hex_to_rgb(self.colors.text_inverted),
-        )
-        draw.text(
-            (self.padding + 45, y + 4),
-            "POWER DYNAMICS",
-            font=marker_font,
-            fill=hex_to_rgb(self.colors.text_primary),
-        )
+        self._draw_section_marker(img, draw, y, "02", "POWER DYNAMICS")
         
         y += 60
         
@@ -616,7 +754,7 @@ class ImageGenerator:
             (self.padding, y),
             "Who actually runs Moltbook?",
             font=headline_font,
-            fill=hex_to_rgb(self.colors.text_primary),
+            fill=self.rgb.text_primary,
         )
         
         y += 70
@@ -630,16 +768,19 @@ class ImageGenerator:
             karma_font = self.fonts.get_font("DMSans-Medium", 18)
             rank_font = self.fonts.get_font("LibreBaskerville-Bold", 72)
             
+            bar_x = self.padding + 100
+            bar_max_width = self.inner_width - 120
+            
             for i, entry in enumerate(top_3):
                 row_y = y + (i * 160)
                 
                 # Large rank number
-                rank_color = self.colors.accent_warm if i == 0 else self.colors.text_tertiary
+                rank_color = self.rgb.accent_warm if i == 0 else self.rgb.text_tertiary
                 draw.text(
                     (self.padding, row_y),
                     str(entry.rank),
                     font=rank_font,
-                    fill=hex_to_rgb(rank_color),
+                    fill=rank_color,
                 )
                 
                 # Name
@@ -647,27 +788,23 @@ class ImageGenerator:
                     (self.padding + 100, row_y + 10),
                     entry.name,
                     font=name_font,
-                    fill=hex_to_rgb(self.colors.text_primary),
+                    fill=self.rgb.text_primary,
                 )
                 
                 # Karma with visual bar
                 bar_y = row_y + 50
-                bar_width = int((entry.karma / max_karma) * (self.inner_width - 120))
-                bar_color = self.colors.accent_signal if i == 0 else self.colors.accent_deep
+                bar_width = entry.karma * bar_max_width // max_karma
+                bar_color = self.rgb.accent_signal if i == 0 else self.rgb.accent_deep
                 
-                draw.rectangle(
-                    [(self.padding + 100, bar_y), 
-                     (self.padding + 100 + bar_width, bar_y + 35)],
-                    fill=hex_to_rgb(bar_color),
-                )
+                _fill_rect(img, bar_x, bar_y, bar_x + bar_width, bar_y + 35, bar_color)
                 
                 # Karma text inside bar
-                karma_text = f"{entry.karma:,} karma"
+                karma_text = f"{_fmt_k(entry.karma)} karma"
                 draw.text(
                     (self.padding + 115, bar_y + 8),
                     karma_text,
                     font=karma_font,
-                    fill=hex_to_rgb(self.colors.text_inverted),
+                    fill=self.rgb.text_inverted,
                 )
         
         # Insight at bottom
@@ -678,7 +815,7 @@ class ImageGenerator:
             insight = f"Notable: {analysis.top_author_posts} has {analysis.top_author_post_count} posts in the top 50"
         elif analysis.leaderboard:
             gap = analysis.leaderboard[0].karma - analysis.leaderboard[1].karma if len(analysis.leaderboard) > 1 else 0
-            insight = f"#1 leads #2 by {gap:,} karma"
+            insight = f"#1 leads #2 by {_fmt_k(gap)} karma"
         else:
             insight = ""
         
@@ -687,36 +824,19 @@ class ImageGenerator:
                 (self.padding, y),
                 insight,
                 font=insight_font,
-                fill=hex_to_rgb(self.colors.accent_signal),
+                fill=self.rgb.accent_signal,
             )
         
-        self._draw_footer(draw)
+        self._draw_footer(img)
         return img
     
-    def _create_hero_card(self, analysis: AnalysisResult) -> Image.Image:
+    def _create_hero_card(self, analysis: AnalysisResult, timestamp: str) -> Image.Image:
         """Create the hero card with headline stat."""
-        img, draw = self._create_base_image()
-        y = self._draw_masthead(draw)
+        img, draw, y = self._create_masthead_image(timestamp)
         
         # Section marker
         y += 40
-        marker_font = self.fonts.get_font("DMSans-Bold", 14)
-        draw.rectangle(
-            [(self.padding, y), (self.padding + 30, y + 24)],
-            fill=hex_to_rgb(self.colors.wayfinding),
-        )
-        draw.text(
-            (self.padding + 8, y + 4),
-            "01",
-            font=marker_font,
-            fill=hex_to_rgb(self.colors.text_inverted),
-        )
-        draw.text(
-            (self.padding + 45, y + 4),
-            "TODAY'S SNAPSHOT",
-            font=marker_font,
-            fill=hex_to_rgb(self.colors.text_primary),
-        )
+        self._draw_section_marker(img, draw, y, "01", "TODAY'S SNAPSHOT")
         
         # Big stat
         y += 100
@@ -725,12 +845,12 @@ class ImageGenerator:
             
             # Karma value (large)
             stat_font = self.fonts.get_font("LibreBaskerville-Bold", 120)
-            karma_text = f"{top.karma:,}"
+            karma_text = _fmt_k(top.karma)
             draw.text(
                 (self.padding, y),
                 karma_text,
                 font=stat_font,
-                fill=hex_to_rgb(self.colors.accent_signal),
+                fill=self.rgb.accent_signal,
             )
             
             # Label
@@ -740,7 +860,7 @@ class ImageGenerator:
                 (self.padding, y),
                 "KARMA",
                 font=label_font,
-                fill=hex_to_rgb(self.colors.text_tertiary),
+                fill=self.rgb.text_tertiary,
             )
             
             # Agent name
@@ -750,21 +870,18 @@ class ImageGenerator:
                 (self.padding, y),
                 top.name,
                 font=name_font,
-                fill=hex_to_rgb(self.colors.text_primary),
+                fill=self.rgb.text_primary,
             )
             
             # Rank badge
             y += 70
             badge_font = self.fonts.get_font("DMSans-Bold", 16)
-            draw.rectangle(
-                [(self.padding, y), (self.padding + 100, y + 32)],
-                fill=hex_to_rgb(self.colors.accent_warm),
-            )
+            _fill_rect(img, self.padding, y, self.padding + 100, y + 32, self.rgb.accent_warm)
             draw.text(
                 (self.padding + 20, y + 7),
                 "#1 RANKED",
                 font=badge_font,
-                fill=hex_to_rgb(self.colors.text_primary),
+                fill=self.rgb.text_primary,
             )
         
         # Network summary at bottom
@@ -776,36 +893,19 @@ class ImageGenerator:
             (self.padding, y),
             summary_text,
             font=summary_font,
-            fill=hex_to_rgb(self.colors.text_secondary),
+            fill=self.rgb.text_secondary,
         )
         
-        self._draw_footer(draw)
+        self._draw_footer(img)
         return img
     
-    def _create_leaderboard_card(self, analysis: AnalysisResult) -> Image.Image:
+    def _create_leaderboard_card(self, analysis: AnalysisResult, timestamp: str) -> Image.Image:
         """Create the leaderboard visualization card."""
-        img, draw = self._create_base_image()
-        y = self._draw_masthead(draw)
+        img, draw, y = self._create_masthead_image(timestamp)
         
         # Section marker
         y += 40
-        marker_font = self.fonts.get_font("DMSans-Bold", 14)
-        draw.rectangle(
-            [(self.padding, y), (self.padding + 30, y + 24)],
-            fill=hex_to_rgb(self.colors.wayfinding),
-        )
-        draw.text(
-            (self.padding + 8, y + 4),
-            "02",
-            font=marker_font,
-            fill=hex_to_rgb(self.colors.text_inverted),
-        )
-        draw.text(
-            (self.padding + 45, y + 4),
-            "KARMA LEADERBOARD",
-            font=marker_font,
-            fill=hex_to_rgb(self.colors.text_primary),
-        )
+        self._draw_section_marker(img, draw, y, "02", "KARMA LEADERBOARD")
         
         # Leaderboard entries
         y += 60
@@ -816,18 +916,19 @@ class ImageGenerator:
         name_font = self.fonts.get_font("DMSans-Medium", 24)
         karma_font = self.fonts.get_font("DMSans-Bold", 20)
         
+        bar_x = self.padding + 70
         bar_max_width = self.inner_width - 200
         
         for i, entry in enumerate(top_5):
             row_y = y + (i * 120)
             
             # Rank number
-            rank_color = self.colors.accent_warm if i < 3 else self.colors.text_tertiary
+            rank_color = self.rgb.accent_warm if i < 3 else self.rgb.text_tertiary
             draw.text(
                 (self.padding, row_y + 10),
                 str(entry.rank),
                 font=rank_font,
-                fill=hex_to_rgb(rank_color),
+                fill=rank_color,
             )
             
             # Name
@@ -835,62 +936,39 @@ class ImageGenerator:
                 (self.padding + 70, row_y + 15),
                 entry.name,
                 font=name_font,
-                fill=hex_to_rgb(self.colors.text_primary),
+                fill=self.rgb.text_primary,
             )
             
             # Karma bar
             bar_y = row_y + 55
-            bar_width = int((entry.karma / max_karma) * bar_max_width)
+            bar_width = entry.karma * bar_max_width // max_karma
             
             # Bar background
-            draw.rectangle(
-                [(self.padding + 70, bar_y), (self.padding + 70 + bar_max_width, bar_y + 24)],
-                fill=hex_to_rgb(self.colors.bg_surface),
-            )
+            _fill_rect(img, bar_x, bar_y, bar_x + bar_max_width, bar_y + 24, self.rgb.bg_surface)
             
             # Bar fill
-            bar_color = self.colors.accent_signal if i == 0 else self.colors.accent_deep
-            draw.rectangle(
-                [(self.padding + 70, bar_y), (self.padding + 70 + bar_width, bar_y + 24)],
-                fill=hex_to_rgb(bar_color),
-            )
+            bar_color = self.rgb.accent_signal if i == 0 else self.rgb.accent_deep
+            _fill_rect(img, bar_x, bar_y, bar_x + bar_width, bar_y + 24, bar_color)
             
             # Karma value
-            karma_text = f"{entry.karma:,}"
+            karma_text = _fmt_k(entry.karma)
             draw.text(
-                (self.padding + 70 + bar_max_width + 15, bar_y + 2),
+                (bar_x + bar_max_width + 15, bar_y + 2),
                 karma_text,
                 font=karma_font,
-                fill=hex_to_rgb(self.colors.accent_warm),
+                fill=self.rgb.accent_warm,
             )
         
-        self._draw_footer(draw)
+        self._draw_footer(img)
         return img
     
-    def _create_network_stats_card(self, analysis: AnalysisResult) -> Image.Image:
+    def _create_network_stats_card(self, analysis: AnalysisResult, timestamp: str) -> Image.Image:
         """Create the network statistics card."""
-        img, draw = self._create_base_image()
-        y = self._draw_masthead(draw)
+        img, draw, y = self._create_masthead_image(timestamp)
         
         # Section marker
         y += 40
-        marker_font = self.fonts.get_font("DMSans-Bold", 14)
-        draw.rectangle(
-            [(self.padding, y), (self.padding + 30, y + 24)],
-            fill=hex_to_rgb(self.colors.wayfinding),
-        )
-        draw.text(
-            (self.padding + 8, y + 4),
-            "03",
-            font=marker_font,
-            fill=hex_to_rgb(self.colors.text_inverted),
-        )
-        draw.text(
-            (self.padding + 45, y + 4),
-            "NETWORK METRICS",
-            font=marker_font,
-            fill=hex_to_rgb(self.colors.text_primary),
-        )
+        self._draw_section_marker(img, draw, y, "03", "NETWORK METRICS")
         
         # Stats grid (2x3)
         y += 80
@@ -912,15 +990,14 @@ class ImageGenerator:
             total_karma = analysis.total_karma
             avg_karma = int(analysis.avg_karma_top10) if analysis.avg_karma_top10 else 0
             top_upvotes = analysis.top_posts[0].upvotes if analysis.top_posts else 0
-            unique_authors = len(set(p.author for p in analysis.top_posts)) if analysis.top_posts else 0
             
             grid_items = [
                 ("AGENTS", str(stats.total_agents)),
                 ("TOP POSTS", str(len(analysis.top_posts))),
-                ("TOTAL KARMA", f"{total_karma:,}"),
-                ("AVG TOP 10", f"{avg_karma:,}"),
-                ("TOP UPVOTES", f"{top_upvotes:,}"),
-                ("AUTHORS", str(unique_authors)),
+                ("TOTAL KARMA", _fmt_k(total_karma)),
+                ("AVG TOP 10", _fmt_k(avg_karma)),
+                ("TOP UPVOTES", _fmt_k(top_upvotes)),
+                ("AUTHORS", str(analysis.unique_top_authors)),
             ]
         
         cell_width = self.inner_width // 2
@@ -929,25 +1006,27 @@ class ImageGenerator:
         label_font = self.fonts.get_font("DMSans-Medium", 16)
         value_font = self.fonts.get_font("LibreBaskerville-Bold", 48)
         
+        # Loop invariants: column offsets, cell extents and colors
+        col_xs = (self.padding, self.padding + cell_width)
+        cell_w = cell_width - 10
+        cell_h = cell_height - 10
+        cell_bg = self.rgb.bg_surface
+        value_fill = self.rgb.text_primary
+        label_fill = self.rgb.text_tertiary
+        
         for i, (label, value) in enumerate(grid_items):
-            col = i % 2
-            row = i // 2
-            
-            cell_x = self.padding + (col * cell_width)
-            cell_y = y + (row * cell_height)
+            cell_x = col_xs[i % 2]
+            cell_y = y + (i // 2) * cell_height
             
             # Cell background
-            draw.rectangle(
-                [(cell_x, cell_y), (cell_x + cell_width - 10, cell_y + cell_height - 10)],
-                fill=hex_to_rgb(self.colors.bg_surface),
-            )
+            _fill_rect(img, cell_x, cell_y, cell_x + cell_w, cell_y + cell_h, cell_bg)
             
             # Value
             draw.text(
                 (cell_x + 20, cell_y + 30),
                 value,
                 font=value_font,
-                fill=hex_to_rgb(self.colors.text_primary),
+                fill=value_fill,
             )
             
             # Label
@@ -955,7 +1034,7 @@ class ImageGenerator:
                 (cell_x + 20, cell_y + 100),
                 label,
                 font=label_font,
-                fill=hex_to_rgb(self.colors.text_tertiary),
+                fill=label_fill,
             )
         
         # Top influencer callout
@@ -966,36 +1045,19 @@ class ImageGenerator:
                 (self.padding, y),
                 f"Top influencer: {stats.top_influencer}",
                 font=callout_font,
-                fill=hex_to_rgb(self.colors.accent_signal),
+                fill=self.rgb.accent_signal,
             )
         
-        self._draw_footer(draw)
+        self._draw_footer(img)
         return img
     
-    def _create_top_post_card(self, analysis: AnalysisResult) -> Image.Image:
+    def _create_top_post_card(self, analysis: AnalysisResult, timestamp: str) -> Image.Image:
         """Create the top post spotlight card."""
-        img, draw = self._create_base_image()
-        y = self._draw_masthead(draw)
+        img, draw, y = self._create_masthead_image(timestamp)
         
         # Section marker
         y += 40
-        marker_font = self.fonts.get_font("DMSans-Bold", 14)
-        draw.rectangle(
-            [(self.padding, y), (self.padding + 30, y + 24)],
-            fill=hex_to_rgb(self.colors.wayfinding),
-        )
-        draw.text(
-            (self.padding + 8, y + 4),
-            "04",
-            font=marker_font,
-            fill=hex_to_rgb(self.colors.text_inverted),
-        )
-        draw.text(
-            (self.padding + 45, y + 4),
-            "TOP POST",
-            font=marker_font,
-            fill=hex_to_rgb(self.colors.text_primary),
-        )
+        self._draw_section_marker(img, draw, y, "04", "TOP POST")
         
         if analysis.top_posts:
             post = analysis.top_posts[0]
@@ -1005,9 +1067,9 @@ class ImageGenerator:
             upvote_font = self.fonts.get_font("LibreBaskerville-Bold", 96)
             draw.text(
                 (self.padding, y),
-                f"{post.upvotes:,}",
+                _fmt_k(post.upvotes),
                 font=upvote_font,
-                fill=hex_to_rgb(self.colors.accent_signal),
+                fill=self.rgb.accent_signal,
             )
             
             y += 110
@@ -1016,46 +1078,33 @@ class ImageGenerator:
                 (self.padding, y),
                 "UPVOTES",
                 font=label_font,
-                fill=hex_to_rgb(self.colors.text_tertiary),
+                fill=self.rgb.text_tertiary,
             )
             
             # Post title (wrapped)
             y += 60
             title_font = self.fonts.get_font("LibreBaskerville-Regular", 32)
             
-            # Simple word wrapping
-            words = post.title.split()
-            lines = []
-            current_line = ""
+            lines = _wrap_text(post.title, title_font, self.inner_width)
             
-            for word in words:
-                test_line = f"{current_line} {word}".strip()
-                bbox = draw.textbbox((0, 0), test_line, font=title_font)
-                if bbox[2] - bbox[0] <= self.inner_width:
-                    current_line = test_line
-                else:
-                    if current_line:
-                        lines.append(current_line)
-                    current_line = word
-            if current_line:
-                lines.append(current_line)
-            
-            # Draw wrapped title (max 4 lines)
-            for line in lines[:4]:
-                draw.text(
-                    (self.padding, y),
-                    line,
-                    font=title_font,
-                    fill=hex_to_rgb(self.colors.text_primary),
-                )
-                y += 45
+            # Draw wrapped title (max 4 lines) in one multiline call; Pillow's
+            # line step is the height of "A" plus spacing, so pad it to 45px
+            shown = lines[:4]
+            draw.multiline_text(
+                (self.padding, y),
+                "\n".join(shown),
+                font=title_font,
+                fill=self.rgb.text_primary,
+                spacing=45 - draw.textbbox((0, 0), "A", font=title_font)[3],
+            )
+            y += 45 * len(shown)
             
             if len(lines) > 4:
                 draw.text(
                     (self.padding, y),
                     "...",
                     font=title_font,
-                    fill=hex_to_rgb(self.colors.text_tertiary),
+                    fill=self.rgb.text_tertiary,
                 )
                 y += 45
             
@@ -1066,16 +1115,16 @@ class ImageGenerator:
                 (self.padding, y),
                 f"by {post.author}",
                 font=author_font,
-                fill=hex_to_rgb(self.colors.accent_deep),
+                fill=self.rgb.accent_deep,
             )
         
-        self._draw_footer(draw)
+        self._draw_footer(img)
         return img
     
-    def _create_cta_card(self, analysis: AnalysisResult) -> Image.Image:
+    def _create_cta_card(self, analysis: AnalysisResult, timestamp: str) -> Image.Image:
         """Create the final CTA card with inverse colors and GitHub preview."""
         # Inverse color scheme - dark background
-        img = Image.new("RGB", self.image_size, hex_to_rgb(self.colors.wayfinding))
+        img = Image.new("RGB", self.image_size, self.rgb.wayfinding)
         draw = ImageDraw.Draw(img)
         
         # No header - start with centered content
@@ -1086,22 +1135,22 @@ class ImageGenerator:
         title_font = self.fonts.get_font("LibreBaskerville-Bold", 48)
         title_text = "MOLT IN THE MIST"
         
-        bbox = draw.textbbox((0, 0), title_text, font=title_font)
-        text_width = bbox[2] - bbox[0]
         draw.text(
-            (center_x - text_width // 2, y),
+            (center_x, y),
             title_text,
             font=title_font,
-            fill=hex_to_rgb(self.colors.text_inverted),
+            fill=self.rgb.text_inverted,
+            anchor="ma",
         )
         
         # Accent rule centered
         y += 70
         rule_width = 100
-        draw.rectangle(
-            [(center_x - rule_width // 2, y), 
-             (center_x + rule_width // 2, y + 4)],
-            fill=hex_to_rgb(self.colors.accent_signal),
+        _fill_rect(
+            img,
+            center_x - rule_width // 2, y,
+            center_x + rule_width // 2, y + 4,
+            self.rgb.accent_signal,
         )
         
         # Tagline
@@ -1109,13 +1158,12 @@ class ImageGenerator:
         tagline_font = self.fonts.get_font("DMSans-Medium", 20)
         tagline_text = "Network Influence Analysis for Moltbook"
         
-        bbox = draw.textbbox((0, 0), tagline_text, font=tagline_font)
-        text_width = bbox[2] - bbox[0]
         draw.text(
-            (center_x - text_width // 2, y),
+            (center_x, y),
             tagline_text,
             font=tagline_font,
-            fill=hex_to_rgb(self.colors.text_tertiary),
+            fill=self.rgb.text_tertiary,
+            anchor="ma",
         )
         
         # GitHub social preview placeholder area
@@ -1128,8 +1176,8 @@ class ImageGenerator:
         # Preview background (slightly lighter than main bg)
         draw.rectangle(
             [(preview_x, y), (preview_x + preview_width, y + preview_height)],
-            fill=hex_to_rgb("#2C3E50"),
-            outline=hex_to_rgb(self.colors.border),
+            fill=self.rgb.accent_deep,
+            outline=self.rgb.border,
             width=2,
         )
         
@@ -1140,7 +1188,7 @@ class ImageGenerator:
             (preview_x + 30, icon_y),
             "github.com",
             font=icon_font,
-            fill=hex_to_rgb(self.colors.text_tertiary),
+            fill=self.rgb.text_tertiary,
         )
         
         # Repo name
@@ -1150,7 +1198,7 @@ class ImageGenerator:
             (preview_x + 30, repo_y),
             "busse/molt-in-the-mist",
             font=repo_font,
-            fill=hex_to_rgb(self.colors.text_inverted),
+            fill=self.rgb.text_inverted,
         )
         
         # Description
@@ -1161,14 +1209,13 @@ class ImageGenerator:
             "and social network analysis. Explore influence,",
             "community structure, and interaction dynamics."
         ]
-        for line in desc_lines:
-            draw.text(
-                (preview_x + 30, desc_y),
-                line,
-                font=desc_font,
-                fill=hex_to_rgb(self.colors.text_tertiary),
-            )
-            desc_y += 28
+        draw.multiline_text(
+            (preview_x + 30, desc_y),
+            "\n".join(desc_lines),
+            font=desc_font,
+            fill=self.rgb.text_tertiary,
+            spacing=28 - draw.textbbox((0, 0), "A", font=desc_font)[3],
+        )
         
         # Stats bar at bottom of preview
         stats_y = y + preview_height - 50
@@ -1178,7 +1225,7 @@ class ImageGenerator:
             (preview_x + 30, stats_y),
             stats,
             font=stats_font,
-            fill=hex_to_rgb(self.colors.accent_warm),
+            fill=self.rgb.accent_warm,
         )
         
         # CTA text below preview
@@ -1186,13 +1233,12 @@ class ImageGenerator:
         cta_font = self.fonts.get_font("DMSans-Bold", 24)
         cta_text = "Explore the code →"
         
-        bbox = draw.textbbox((0, 0), cta_text, font=cta_font)
-        text_width = bbox[2] - bbox[0]
         draw.text(
-            (center_x - text_width // 2, y),
+            (center_x, y),
             cta_text,
             font=cta_font,
-            fill=hex_to_rgb(self.colors.accent_signal),
+            fill=self.rgb.accent_signal,
+            anchor="ma",
         )
         
         # URL at bottom
@@ -1200,13 +1246,12 @@ class ImageGenerator:
         url_font = self.fonts.get_font("DMSans-Medium", 18)
         url_text = "github.com/busse/molt-in-the-mist"
         
-        bbox = draw.textbbox((0, 0), url_text, font=url_font)
-        text_width = bbox[2] - bbox[0]
         draw.text(
-            (center_x - text_width // 2, y),
+            (center_x, y),
             url_text,
             font=url_font,
-            fill=hex_to_rgb(self.colors.text_inverted),
+            fill=self.rgb.text_inverted,
+            anchor="ma",
         )
         
         return img
@@ -61,18 +61,22 @@ class MarkdownGenerator:
         Returns:
             Path to the generated markdown file
         """
+        # Shared by the headline, summary and quick-copy text
+        stats = analysis.summary_stats()
+        
         # Generate headline if not provided
         if headline is None:
-            headline = self._generate_headline(analysis)
+            headline = self._generate_headline(analysis, stats)
         
         # Generate summary
-        summary = self._generate_summary(analysis)
+        summary = self._generate_summary(analysis, stats)
         
         # Build the markdown content
         content = self._build_markdown(
             headline=headline,
             summary=summary,
             analysis=analysis,
+            stats=stats,
             image_paths=image_paths,
             output_dir=output_dir,
             platform=platform,
@@ -84,10 +88,8 @@ class MarkdownGenerator:
         
         return output_path
     
-    def _generate_headline(self, analysis: AnalysisResult) -> str:
+    def _generate_headline(self, analysis: AnalysisResult, stats: dict[str, Any]) -> str:
         """Generate a punchy headline from the data."""
-        stats = analysis.summary_stats()
-        
         if analysis.leaderboard:
             top = analysis.leaderboard[0]
             # Variety of headline templates (avoid using 0 values)
@@ -108,10 +110,8 @@ class MarkdownGenerator:
         
         return "Moltbook Network Analysis Update"
     
-    def _generate_summary(self, analysis: AnalysisResult) -> str:
+    def _generate_summary(self, analysis: AnalysisResult, stats: dict[str, Any]) -> str:
         """Generate a summary paragraph from the data."""
-        stats = analysis.summary_stats()
-        
         parts = []
         
         # Opening stat
@@ -155,6 +155,7 @@ class MarkdownGenerator:
         headline: str,
         summary: str,
         analysis: AnalysisResult,
+        stats: dict[str, Any],
         image_paths: list[Path],
         output_dir: Path,
         platform: str = "threads",
@@ -210,7 +211,7 @@ class MarkdownGenerator:
 
 **Summary (for post caption):**
 ```
-{self._plain_summary(analysis)}
+{self._plain_summary(analysis, stats)}
 ```
 
 ---
@@ -308,9 +309,8 @@ class MarkdownGenerator:
         
         return "\n".join(lines)
     
-    def _plain_summary(self, analysis: AnalysisResult) -> str:
+    def _plain_summary(self, analysis: AnalysisResult, stats: dict[str, Any]) -> str:
         """Generate a plain text summary for easy copying."""
-        stats = analysis.summary_stats()
         parts = []
         
         if analysis.leaderboard: